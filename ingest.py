@@ -9,24 +9,21 @@ Source: https://doi.org/10.5284/1027216
 """
 
 import csv
+import hashlib
+import io
 import logging
 import os
 import re
 import sys
 import uuid
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
+from itertools import repeat
 from typing import Optional
 from urllib.request import urlretrieve
 
-import psycopg2
-import psycopg2.extras
-from psycopg2.extras import execute_batch, execute_values
-
-# Register UUID adapter for psycopg2
-psycopg2.extras.register_uuid()
-
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -54,7 +51,14 @@ class Config:
 
     # Processing options
     batch_size: int = 500
+    pool_min_connections: int = 2
+    pool_max_connections: int = 8
+    copy_flush_rows: int = 10000
+    execute_values_page_size: int = 1000
+    use_copy: bool = True
     skip_existing: bool = True
+    force_reingest: bool = False
+    jobs: int = 1
     validate_coordinates: bool = True
 
     # Australian coordinate bounds
@@ -146,13 +150,43 @@ STATE_MAPPING = {
 }
 
 
+def compile_substring_pattern(mapping: dict):
+    """Combine a mapping's substring patterns into one alternation regex.
+
+    One compiled scan replaces a Python-level substring test per pattern;
+    longer patterns are tried first so the most specific match wins.
+    """
+    alternation = '|'.join(
+        re.escape(pattern)
+        for pattern in sorted(mapping, key=len, reverse=True)
+    )
+    return re.compile(alternation)
+
+
+MATERIAL_PATTERN = compile_substring_pattern(MATERIAL_MAPPING)
+METHOD_PATTERN = compile_substring_pattern(METHOD_MAPPING)
+
+
 # =============================================================================
 # Database Connection
 # =============================================================================
 
-def get_connection(config: Config):
-    """Create database connection."""
-    return psycopg2.connect(
+def get_connection_pool(config: Config):
+    """Create the connection pool shared by the pipeline steps.
+
+    psycopg2 is imported here rather than at module scope so CLI runs
+    that never touch the database (--help, argument errors) do not pay
+    the libpq load; parse worker processes skip it the same way.
+    """
+    import psycopg2.extras
+    from psycopg2.pool import ThreadedConnectionPool
+
+    # Register UUID adapter for psycopg2
+    psycopg2.extras.register_uuid()
+
+    return ThreadedConnectionPool(
+        config.pool_min_connections,
+        config.pool_max_connections,
         host=config.db_host,
         port=config.db_port,
         dbname=config.db_name,
@@ -165,12 +199,28 @@ def get_connection(config: Config):
 # Data Parsing Utilities
 # =============================================================================
 
+# Precompiled patterns for the per-row parsing hot path
+YEAR_RE = re.compile(r'\b(19\d{2}|20\d{2})\b')
+WHITESPACE_RE = re.compile(r'\s+')
+NONWORD_RE = re.compile(r'[^\w\s]')
+TRAILING_PUNCT_RE = re.compile(r'[,\.\(\)]+$')
+
+
+# Sentinels and translation table for parse_float, hoisted out of the
+# ~8 calls per row
+NULL_TOKENS = frozenset(('', 'NA', 'N/A', '-', 'null', 'NULL'))
+COMMA_STRIP = str.maketrans('', '', ',')
+
+
 def parse_float(value: str) -> Optional[float]:
     """Parse a float value, returning None for empty/invalid."""
-    if not value or value.strip() in ('', 'NA', 'N/A', '-', 'null', 'NULL'):
+    if not value:
+        return None
+    value = value.strip()
+    if value in NULL_TOKENS:
         return None
     try:
-        return float(value.strip().replace(',', ''))
+        return float(value.translate(COMMA_STRIP))
     except ValueError:
         return None
 
@@ -182,18 +232,19 @@ def parse_int(value: str) -> Optional[int]:
 
 
 def normalize_material(description: str) -> str:
-    """Normalize material description to standard code."""
+    """Normalize material description to standard code.
+
+    All pattern mentions are collected in one scan and the longest wins,
+    so the most specific material ('emu eggshell', 'burnt bone') beats a
+    shorter match elsewhere in the description.
+    """
     if not description:
         return 'UNKNOWN'
 
     desc_lower = description.lower().strip()
 
-    # Check for exact matches first
-    for pattern, code in MATERIAL_MAPPING.items():
-        if pattern in desc_lower:
-            return code
-
-    return 'OTHER'
+    best = max(MATERIAL_PATTERN.findall(desc_lower), key=len, default=None)
+    return MATERIAL_MAPPING[best] if best else 'OTHER'
 
 
 def normalize_method(description: str) -> str:
@@ -203,9 +254,9 @@ def normalize_method(description: str) -> str:
 
     desc_lower = description.lower().strip()
 
-    for pattern, code in METHOD_MAPPING.items():
-        if pattern in desc_lower:
-            return code
+    match = METHOD_PATTERN.search(desc_lower)
+    if match:
+        return METHOD_MAPPING[match.group(0)]
 
     # Check lab code prefixes for method hints
     return 'C14'  # Default
@@ -238,6 +289,8 @@ IBRA_STATE_HINTS = {
     'australian alps': 'ACT',
 }
 
+IBRA_PATTERN = compile_substring_pattern(IBRA_STATE_HINTS)
+
 
 def derive_state_from_ibra(ibra_region: str) -> Optional[str]:
     """Derive state from IBRA bioregion name."""
@@ -246,11 +299,8 @@ def derive_state_from_ibra(ibra_region: str) -> Optional[str]:
 
     ibra_lower = ibra_region.lower().strip()
 
-    for hint, state in IBRA_STATE_HINTS.items():
-        if hint in ibra_lower:
-            return state
-
-    return None
+    match = IBRA_PATTERN.search(ibra_lower)
+    return IBRA_STATE_HINTS[match.group(0)] if match else None
 
 
 def parse_depth(depth_str: str) -> Optional[float]:
@@ -272,40 +322,51 @@ def parse_depth(depth_str: str) -> Optional[float]:
     return parse_float(depth_str)
 
 
+# Lab code prefixes hinting at the dating method
+AMS_LAB_PREFIXES = ('OZ', 'SANU', 'ANUA', 'CAMS', 'AA-', 'BETA', 'UBA', 'UCIAMS', 'D-AMS')
+CONV_LAB_PREFIXES = ('I-', 'GX-', 'GAK-', 'SUA-', 'ANU-', 'NZ-', 'GRN-', 'W-')
+
+
 def determine_method(method_str: str, technique_str: str, lab_code: str) -> str:
     """Determine dating method from METHOD, TECHNIQUE columns and lab code."""
-    combined = f"{method_str} {technique_str}".lower()
-
-    # Check for luminescence methods first
-    if 'osl' in combined or 'optically stimulated' in combined:
-        return 'OSL'
-    if 'tl' in combined or 'thermoluminescence' in combined:
-        return 'TL'
-    if 'irsl' in combined:
-        return 'IRSL'
-
-    # Check for other non-C14 methods
-    if 'u-th' in combined or 'uranium' in combined or 'u-series' in combined:
-        return 'U-TH'
-    if 'esr' in combined or 'electron spin' in combined:
-        return 'ESR'
-    if 'aar' in combined or 'amino acid' in combined:
-        return 'AAR'
-
-    # Default to radiocarbon, but try to distinguish AMS vs conventional
-    if 'ams' in combined or 'accelerator' in combined:
-        return 'AMS'
-    if 'conventional' in combined or 'radiometric' in combined:
-        return 'CONV'
+    # Lowercase each input once and skip the combined-string allocation
+    # when a field is empty (the common case in AustArch)
+    method_str = method_str.lower() if method_str else ''
+    technique_str = technique_str.lower() if technique_str else ''
+    if method_str and technique_str:
+        combined = method_str + ' ' + technique_str
+    else:
+        combined = method_str or technique_str
+
+    if combined:
+        # Check for luminescence methods first
+        if 'osl' in combined or 'optically stimulated' in combined:
+            return 'OSL'
+        if 'tl' in combined or 'thermoluminescence' in combined:
+            return 'TL'
+        if 'irsl' in combined:
+            return 'IRSL'
+
+        # Check for other non-C14 methods
+        if 'u-th' in combined or 'uranium' in combined or 'u-series' in combined:
+            return 'U-TH'
+        if 'esr' in combined or 'electron spin' in combined:
+            return 'ESR'
+        if 'aar' in combined or 'amino acid' in combined:
+            return 'AAR'
+
+        # Default to radiocarbon, but try to distinguish AMS vs conventional
+        if 'ams' in combined or 'accelerator' in combined:
+            return 'AMS'
+        if 'conventional' in combined or 'radiometric' in combined:
+            return 'CONV'
 
     # Infer from lab code prefixes
     if lab_code:
         lab_upper = lab_code.upper()
-        # AMS labs
-        if lab_upper.startswith(('OZ', 'SANU', 'ANUA', 'CAMS', 'AA-', 'BETA', 'UBA', 'UCIAMS', 'D-AMS')):
+        if lab_upper.startswith(AMS_LAB_PREFIXES):
             return 'AMS'
-        # Conventional labs
-        if lab_upper.startswith(('I-', 'GX-', 'GAK-', 'SUA-', 'ANU-', 'NZ-', 'GRN-', 'W-')):
+        if lab_upper.startswith(CONV_LAB_PREFIXES):
             return 'CONV'
 
     # Default to generic C14
@@ -319,7 +380,7 @@ def parse_lab_code(code: str) -> Optional[str]:
 
     cleaned = code.strip().upper()
     # Remove common prefixes/suffixes that aren't part of the code
-    cleaned = re.sub(r'\s+', '', cleaned)
+    cleaned = WHITESPACE_RE.sub('', cleaned)
 
     return cleaned if len(cleaned) >= 3 else None
 
@@ -343,14 +404,14 @@ def parse_citation(text: str) -> dict:
         return result
 
     # Try to extract year (4 digits, likely 19xx or 20xx)
-    year_match = re.search(r'\b(19\d{2}|20\d{2})\b', text)
+    year_match = YEAR_RE.search(text)
     if year_match:
         result['year'] = int(year_match.group(1))
 
     # Extract author (text before year or before first comma)
     if year_match:
         author_text = text[:year_match.start()].strip()
-        author_text = re.sub(r'[,\.\(\)]+$', '', author_text)
+        author_text = TRAILING_PUNCT_RE.sub('', author_text)
         if author_text:
             result['author'] = author_text
 
@@ -368,19 +429,35 @@ def normalize_site_name(name: str) -> str:
 
     # Lowercase, remove punctuation, normalize whitespace
     normalized = name.lower()
-    normalized = re.sub(r'[^\w\s]', ' ', normalized)
+    normalized = NONWORD_RE.sub(' ', normalized)
     normalized = ' '.join(normalized.split())
 
     return normalized
 
 
-def find_existing_site(cursor, name: str, lat: float, lon: float) -> Optional[int]:
+def site_coord_key(lat: Optional[float], lon: Optional[float]) -> Optional[tuple]:
+    """Round coordinates to ~100 m for use as a proximity cache key."""
+    if lat is None or lon is None:
+        return None
+    return (round(lat, 3), round(lon, 3))
+
+
+def find_existing_site(cursor, ref_cache, name: str, lat: float, lon: float) -> Optional[int]:
     """Find existing site by name match or proximity.
 
+    Hits are served from the in-memory site cache where possible; the
+    name-match and proximity queries only run on a cache miss, and their
+    results are cached for the (very common) case of many rows per site.
+
     If a site is found by name but has no coordinates, and the current row
     has coordinates, update the site with those coordinates.
     """
     normalized = normalize_site_name(name)
+    coord_key = site_coord_key(lat, lon)
+
+    site_id = ref_cache.get_cached_site(normalized, coord_key)
+    if site_id is not None:
+        return site_id
 
     # First try exact name match
     cursor.execute("""
@@ -392,12 +469,15 @@ def find_existing_site(cursor, name: str, lat: float, lon: float) -> Optional[in
     result = cursor.fetchone()
     if result:
         site_id, existing_lat, existing_lon = result
-        # Update coordinates if site has none but current row does
+        # Update coordinates if site has none but current row does;
+        # deferred and applied in one bulk UPDATE at end of file
         if (existing_lat is None or existing_lon is None) and lat is not None and lon is not None:
-            cursor.execute("""
-                UPDATE site SET latitude = %s, longitude = %s
-                WHERE id = %s
-            """, (lat, lon, site_id))
+            ref_cache.pending_coord_updates.append((site_id, lat, lon))
+            existing_lat, existing_lon = lat, lon
+        # Only cache sites that have coordinates: a coordinate-less site
+        # must keep hitting the DB path so a later row can backfill it
+        if existing_lat is not None and existing_lon is not None:
+            ref_cache.cache_site(site_id, normalized, coord_key)
         return site_id
 
     # Try spatial proximity (within ~100m)
@@ -415,6 +495,7 @@ def find_existing_site(cursor, name: str, lat: float, lon: float) -> Optional[in
 
         result = cursor.fetchone()
         if result:
+            ref_cache.cache_site(result[0], normalized, coord_key)
             return result[0]
 
     return None
@@ -432,6 +513,11 @@ class ReferenceDataCache:
         self._methods = {}
         self._materials = {}
         self._sources = {}
+        self._existing_labs = set()
+        self._site_by_name = {}
+        self._site_by_coord = {}
+        # Deferred site coordinate backfills, applied in bulk per file
+        self.pending_coord_updates = []
         self._load_reference_data()
 
     def _load_reference_data(self):
@@ -442,6 +528,63 @@ class ReferenceDataCache:
         self.cursor.execute("SELECT id, code FROM sample_material")
         self._materials = {row[1]: row[0] for row in self.cursor.fetchall()}
 
+        # All existing lab codes, for in-memory duplicate detection.
+        # These preloads can reach millions of rows, so stream them out
+        # via COPY rather than SELECT + fetchall
+        self._existing_labs = {
+            row[0]
+            for row in self._copy_out("SELECT lab_code FROM age_determination")
+        }
+
+        # Warm the site cache so re-runs skip the per-row lookup queries
+        for site_id, name, lat, lon in self._copy_out(
+                "SELECT id, site_name, latitude, longitude FROM site"):
+            if lat and lon:
+                self.cache_site(int(site_id), normalize_site_name(name),
+                                site_coord_key(float(lat), float(lon)))
+
+        # Bioregion envelopes for the ingest-time assignment prefilter
+        self.cursor.execute("""
+            SELECT id, ST_XMin(geom), ST_YMin(geom), ST_XMax(geom), ST_YMax(geom)
+            FROM bioregion
+            WHERE geom IS NOT NULL
+        """)
+        self._bioregion_boxes = self.cursor.fetchall()
+
+    def lookup_bioregion(self, lat: Optional[float],
+                         lon: Optional[float]) -> Optional[int]:
+        """Resolve a point's bioregion at ingest time.
+
+        The cached envelopes prefilter candidates in memory; only when a
+        bounding box matches does one ANY-restricted ST_Contains probe
+        run. Points outside every envelope cost no SQL at all. Assigning
+        the id on the INSERT lets the trg_assign_bioregion trigger skip
+        its per-insert full-table containment subquery.
+        """
+        if lat is None or lon is None or not self._bioregion_boxes:
+            return None
+
+        candidates = [box[0] for box in self._bioregion_boxes
+                      if box[1] <= lon <= box[3] and box[2] <= lat <= box[4]]
+        if not candidates:
+            return None
+
+        self.cursor.execute("""
+            SELECT id FROM bioregion
+            WHERE id = ANY(%s)
+              AND ST_Contains(geom, ST_SetSRID(ST_MakePoint(%s, %s), 4283))
+            LIMIT 1
+        """, (candidates, lon, lat))
+        result = self.cursor.fetchone()
+        return result[0] if result else None
+
+    def _copy_out(self, sql: str):
+        """Stream a query's rows out via COPY, skipping row-by-row framing."""
+        buf = io.StringIO()
+        self.cursor.copy_expert(f"COPY ({sql}) TO STDOUT WITH CSV", buf)
+        buf.seek(0)
+        return csv.reader(buf)
+
     def get_method_id(self, code: str) -> Optional[int]:
         return self._methods.get(code)
 
@@ -482,6 +625,32 @@ class ReferenceDataCache:
 
         return None
 
+    def lab_code_exists(self, lab_code: str) -> bool:
+        return lab_code in self._existing_labs
+
+    def add_lab_codes(self, codes) -> None:
+        """Record lab codes that have been flushed to the database."""
+        self._existing_labs.update(codes)
+
+    def get_cached_site(self, normalized_name: str, coord_key) -> Optional[int]:
+        """Look up a site id by normalized name, then by rounded coordinates."""
+        site_id = self._site_by_name.get(normalized_name)
+        if site_id is None and coord_key is not None:
+            site_id = self._site_by_coord.get(coord_key)
+        return site_id
+
+    def cache_site(self, site_id: int, normalized_name: str, coord_key) -> None:
+        if normalized_name:
+            self._site_by_name[normalized_name] = site_id
+        if coord_key is not None:
+            self._site_by_coord.setdefault(coord_key, site_id)
+
+    def invalidate_caches(self) -> None:
+        """Drop cached ids that a rollback may have undone."""
+        self._sources.clear()
+        self._site_by_name.clear()
+        self._site_by_coord.clear()
+
 
 # =============================================================================
 # Main Ingestion Functions
@@ -498,102 +667,263 @@ class IngestStats:
     errors: list = field(default_factory=list)
 
 
-def process_radiocarbon_row(
-    row: dict,
-    cursor,
-    ref_cache: ReferenceDataCache,
-    config: Config,
-    batch_id: uuid.UUID,
-    stats: IngestStats
-) -> None:
-    """Process a single row from AustArch data file."""
+@dataclass
+class ParsedRow:
+    """A CSV row parsed and normalized, ready to be applied to the database.
 
-    # Extract and validate coordinates
-    # Column names: LATITUDE, LONGITUDE
-    lat = parse_float(row.get('LATITUDE'))
-    lon = parse_float(row.get('LONGITUDE'))
+    Produced by the pure parse stage (safe to build in a worker process);
+    consumed by the apply stage, which owns all database access.
+    """
+    row_num: int
+    lab_code: str
+    site_name: str
+    site_type: str
+    ibra_region: str
+    state: Optional[str]
+    latitude: Optional[float]
+    longitude: Optional[float]
+    material_code: str
+    material_description: str
+    depth_cm_top: Optional[float]
+    context: str
+    method_code: str
+    c14_age: Optional[int]
+    c14_error: Optional[int]
+    delta_c13: Optional[float]
+    lum_age_ka: Optional[float]
+    lum_error_ka: Optional[float]
+    citation: str
+    is_rejected: bool
+    rejection_reason: Optional[str]
+    quality_issues: Optional[list]
+    notes: str
+    coordinate_error: Optional[str] = None
 
-    if lat is not None and lon is not None:
-        if config.validate_coordinates and not validate_coordinates(lat, lon, config):
-            stats.errors.append(f"Invalid coordinates: {lat}, {lon}")
-            lat, lon = None, None
 
-    # Age determination - validate lab code FIRST before creating site/sample
-    # Column names: LAB_CODE, AGE, ERROR, C13_AGE, C13_ERROR, METHOD, TECHNIQUE
-    lab_code = parse_lab_code(row.get('LAB_CODE'))
+# =============================================================================
+# Bulk Loading
+# =============================================================================
 
-    if not lab_code:
-        stats.ages_skipped += 1
+# Columns loaded into sample, in INSERT order
+SAMPLE_COLUMNS = (
+    'site_id', 'material_id', 'material_description',
+    'depth_cm_top', 'cultural_association',
+)
+
+SAMPLE_INSERT_VALUES_SQL = "INSERT INTO sample ({}) VALUES %s RETURNING id".format(
+    ', '.join(SAMPLE_COLUMNS)
+)
+
+SAMPLE_INSERT_SQL = "INSERT INTO sample ({}) VALUES ({}) RETURNING id".format(
+    ', '.join(SAMPLE_COLUMNS), ', '.join(['%s'] * len(SAMPLE_COLUMNS))
+)
+
+# Columns loaded into age_determination, in COPY/INSERT order
+AGE_COLUMNS = (
+    'sample_id', 'lab_code', 'method_id',
+    'c14_age', 'c14_error', 'delta_c13',
+    'lum_age_ka', 'lum_error_ka',
+    'age_bp', 'age_error',
+    'is_rejected', 'rejection_reason', 'quality_issues',
+    'data_source_id', 'notes', 'import_batch_id',
+)
+
+AGE_COPY_SQL = "COPY age_determination ({}) FROM STDIN".format(', '.join(AGE_COLUMNS))
+
+AGE_INSERT_VALUES_SQL = "INSERT INTO age_determination ({}) VALUES %s".format(
+    ', '.join(AGE_COLUMNS)
+)
+
+AGE_INSERT_SQL = "INSERT INTO age_determination ({}) VALUES ({})".format(
+    ', '.join(AGE_COLUMNS), ', '.join(['%s'] * len(AGE_COLUMNS))
+)
+
+
+@dataclass
+class RowBuffer:
+    """Buffered sample and age rows awaiting a bulk flush.
+
+    Samples and ages are appended pairwise: ages[i] belongs to samples[i]
+    and is stored without its sample_id, which is filled in at flush time
+    from the ids RETURNING'd by the batched sample INSERT.
+    """
+    samples: list = field(default_factory=list)
+    ages: list = field(default_factory=list)
+    pending_lab_codes: set = field(default_factory=set)
+
+    def add(self, sample_row: tuple, age_row: tuple, lab_code: str) -> None:
+        self.samples.append(sample_row)
+        self.ages.append(age_row)
+        self.pending_lab_codes.add(lab_code)
+
+    def clear(self) -> None:
+        self.samples.clear()
+        self.ages.clear()
+        self.pending_lab_codes.clear()
+
+
+def format_copy_value(value) -> str:
+    """Format a Python value for PostgreSQL COPY text format."""
+    if value is None:
+        return r'\N'
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    if isinstance(value, list):
+        # TEXT[] array literal, e.g. {"issue one","issue two"}
+        items = ['"{}"'.format(str(v).replace('\\', '\\\\').replace('"', '\\"'))
+                 for v in value]
+        value = '{' + ','.join(items) + '}'
+    return (str(value)
+            .replace('\\', '\\\\')
+            .replace('\t', '\\t')
+            .replace('\n', '\\n')
+            .replace('\r', '\\r'))
+
+
+def flush_row_buffer(cursor, buffer: RowBuffer, ref_cache: ReferenceDataCache,
+                     config: Config, stats: IngestStats) -> None:
+    """Flush buffered samples and ages to Postgres in bulk.
+
+    Samples go in as a single multi-VALUES INSERT via execute_values
+    (one statement per page instead of one per row); the RETURNING'd ids
+    are zipped back onto the paired age rows, which then stream in via
+    COPY. If the bulk path fails (e.g. one bad row), fall back to
+    row-at-a-time INSERTs under savepoints so a single record cannot
+    sink the batch.
+    """
+    if not buffer.samples:
         return
 
-    # Check for duplicate lab code before creating any records
-    if config.skip_existing:
-        cursor.execute(
-            "SELECT id FROM age_determination WHERE lab_code = %s",
-            (lab_code,)
+    from psycopg2.extras import execute_values
+
+    try:
+        cursor.execute("SAVEPOINT bulk_flush")
+
+        sample_ids = execute_values(
+            cursor, SAMPLE_INSERT_VALUES_SQL, buffer.samples,
+            page_size=config.execute_values_page_size, fetch=True
         )
-        if cursor.fetchone():
-            stats.ages_skipped += 1
-            return
+
+        age_rows = [(sample_id,) + age
+                    for (sample_id,), age in zip(sample_ids, buffer.ages)]
+        if config.use_copy:
+            payload = io.StringIO(
+                '\n'.join('\t'.join(format_copy_value(v) for v in row)
+                          for row in age_rows) + '\n'
+            )
+            cursor.copy_expert(AGE_COPY_SQL, payload)
+        else:
+            execute_values(cursor, AGE_INSERT_VALUES_SQL, age_rows,
+                           page_size=config.execute_values_page_size)
+
+        cursor.execute("RELEASE SAVEPOINT bulk_flush")
+        ref_cache.add_lab_codes(age[0] for age in buffer.ages)
+        stats.samples_created += len(sample_ids)
+        stats.ages_created += len(age_rows)
+    except Exception as e:
+        cursor.execute("ROLLBACK TO SAVEPOINT bulk_flush")
+        logger.warning(f"Bulk flush of {len(buffer.samples)} rows failed ({e}); "
+                       "retrying rows individually")
+        for sample_row, age_row in zip(buffer.samples, buffer.ages):
+            try:
+                cursor.execute("SAVEPOINT flush_row")
+                cursor.execute(SAMPLE_INSERT_SQL, sample_row)
+                sample_id = cursor.fetchone()[0]
+                cursor.execute(AGE_INSERT_SQL, (sample_id,) + age_row)
+                cursor.execute("RELEASE SAVEPOINT flush_row")
+                ref_cache.add_lab_codes((age_row[0],))
+                stats.samples_created += 1
+                stats.ages_created += 1
+            except Exception as row_error:
+                cursor.execute("ROLLBACK TO SAVEPOINT flush_row")
+                stats.errors.append(f"Age {age_row[0]}: {row_error}")
+    finally:
+        buffer.clear()
+
+
+# Columns consumed from AustArch data files, in extractor order
+ROW_FIELDS = (
+    'LAB_CODE', 'LATITUDE', 'LONGITUDE', 'SITE', 'SITE_TYPE', 'IBRA_REGION',
+    'MATERIAL', 'MATERIAL_TOP_LEVEL', 'DEPTH_FROM_SURFACE_CM', 'CONTEXT',
+    'AGE', 'ERROR', 'C13_AGE', 'C13_ERROR', 'METHOD', 'TECHNIQUE', 'SOURCE',
+    'DATE_ISSUES', 'ADDITIONAL_DATA_ISSUES', 'NOTES',
+)
+
+
+def make_row_extractor(columns: dict):
+    """Build a field extractor specialized to one file's header layout.
+
+    The needed column indices are resolved once per file and bound into
+    the closure, so each row costs plain list indexing with a short-row
+    guard instead of a dict lookup per field.
+    """
+    indices = tuple(columns.get(name) for name in ROW_FIELDS)
+
+    def extract(row: list) -> tuple:
+        n = len(row)
+        return tuple(row[i] if i is not None and i < n else None
+                     for i in indices)
+
+    return extract
+
+
+def parse_row(
+    fields: tuple,
+    row_num: int,
+    config: Config
+) -> Optional[ParsedRow]:
+    """Parse a single extracted row from an AustArch data file.
+
+    Pure function: no database access, so it can run in a worker process.
+    Returns None for rows without a usable lab code.
+    """
+    (lab_code_raw, lat_raw, lon_raw, site_raw, site_type_raw, ibra_raw,
+     material_raw, material_top_raw, depth_raw, context_raw, age_raw,
+     error_raw, c13_age_raw, c13_error_raw, method_raw, technique_raw,
+     source_raw, date_issues_raw, additional_raw, notes_raw) = fields
+
+    # Age determination - validate lab code FIRST before doing any work
+    lab_code = parse_lab_code(lab_code_raw)
+
+    if not lab_code:
+        return None
+
+    # Extract and validate coordinates
+    lat = parse_float(lat_raw)
+    lon = parse_float(lon_raw)
+
+    coordinate_error = None
+    if lat is not None and lon is not None:
+        if config.validate_coordinates and not validate_coordinates(lat, lon, config):
+            coordinate_error = f"Invalid coordinates: {lat}, {lon}"
+            lat, lon = None, None
 
     # Site data
-    # Column names: SITE, SITE_TYPE, IBRA_REGION
-    site_name = (row.get('SITE') or 'Unknown Site').strip()
-    site_type = row.get('SITE_TYPE') or ''
-    ibra_region = row.get('IBRA_REGION') or ''
+    site_name = (site_raw or 'Unknown Site').strip()
+    site_type = site_type_raw or ''
+    ibra_region = ibra_raw or ''
 
     # Derive state from IBRA region if possible
     state = derive_state_from_ibra(ibra_region)
 
-    # Find or create site
-    site_id = find_existing_site(cursor, site_name, lat, lon)
-
-    if site_id:
-        stats.sites_matched += 1
-    else:
-        cursor.execute("""
-            INSERT INTO site (site_name, latitude, longitude, state, site_type, region, import_batch_id)
-            VALUES (%s, %s, %s, %s, %s, %s, %s)
-            RETURNING id
-        """, (site_name, lat, lon, state, site_type, ibra_region, batch_id))
-        site_id = cursor.fetchone()[0]
-        stats.sites_created += 1
-
     # Sample data
-    # Column names: MATERIAL, MATERIAL_TOP_LEVEL, DEPTH_FROM_SURFACE_CM, CONTEXT
-    material_desc = row.get('MATERIAL') or ''
-    material_top = row.get('MATERIAL_TOP_LEVEL') or ''
+    material_desc = material_raw or ''
+    material_top = material_top_raw or ''
     material_code = normalize_material(material_desc or material_top)
-    material_id = ref_cache.get_material_id(material_code)
-
-    depth_str = row.get('DEPTH_FROM_SURFACE_CM') or ''
-    depth_top = parse_depth(depth_str)
-    context = row.get('CONTEXT') or ''
 
-    cursor.execute("""
-        INSERT INTO sample (
-            site_id, material_id, material_description,
-            depth_cm_top, cultural_association
-        )
-        VALUES (%s, %s, %s, %s, %s)
-        RETURNING id
-    """, (site_id, material_id, material_desc, depth_top, context))
-    sample_id = cursor.fetchone()[0]
-    stats.samples_created += 1
+    depth_top = parse_depth(depth_raw or '')
+    context = context_raw or ''
 
     # Parse ages - AGE and ERROR are the main columns
-    c14_age = parse_int(row.get('AGE'))
-    c14_error = parse_int(row.get('ERROR'))
+    c14_age = parse_int(age_raw)
+    c14_error = parse_int(error_raw)
 
     # C13 values (isotopic correction)
-    c13_age = parse_float(row.get('C13_AGE'))
-    c13_error = parse_float(row.get('C13_ERROR'))
+    c13_age = parse_float(c13_age_raw)
+    c13_error = parse_float(c13_error_raw)
 
     # Determine method from METHOD and TECHNIQUE columns
-    method_str = row.get('METHOD') or ''
-    technique_str = row.get('TECHNIQUE') or ''
-    method_code = determine_method(method_str, technique_str, lab_code)
-    method_id = ref_cache.get_method_id(method_code)
+    method_code = determine_method(method_raw or '', technique_raw or '', lab_code)
 
     # For luminescence ages, convert to ka
     lum_age_ka = None
@@ -606,93 +936,354 @@ def process_radiocarbon_row(
             lum_error_ka = c14_error / 1000.0
 
     # Citation/source - SOURCE column
-    citation = row.get('SOURCE') or ''
-    source_id = ref_cache.get_or_create_source(citation) if citation else None
+    citation = source_raw or ''
 
-    # Quality flags - DATE_ISSUES and ADDITIONAL_DATA_ISSUES columns
-    date_issues = row.get('DATE_ISSUES') or ''
-    additional_issues = row.get('ADDITIONAL_DATA_ISSUES') or ''
-    notes = row.get('NOTES') or ''
+    # Quality flags - DATE_ISSUES and ADDITIONAL_DATA_ISSUES columns.
+    # Mostly empty in AustArch, so strip each once and short-circuit the
+    # lowercased rejection scan when there are no notes
+    date_issues = date_issues_raw.strip() if date_issues_raw else ''
+    additional_issues = additional_raw.strip() if additional_raw else ''
+    notes = notes_raw or ''
 
     # Determine if rejected based on issues
-    is_rejected = bool(date_issues.strip()) or 'reject' in notes.lower()
-    rejection_reason = date_issues if is_rejected else None
+    is_rejected = bool(date_issues) or bool(notes and 'reject' in notes.casefold())
+    rejection_reason = (date_issues_raw or '') if is_rejected else None
 
     # Quality issues array
     quality_issues = []
-    if date_issues.strip():
-        quality_issues.append(date_issues.strip())
-    if additional_issues.strip():
-        quality_issues.append(additional_issues.strip())
+    if date_issues:
+        quality_issues.append(date_issues)
+    if additional_issues:
+        quality_issues.append(additional_issues)
+
+    return ParsedRow(
+        row_num=row_num,
+        lab_code=lab_code,
+        site_name=site_name,
+        site_type=site_type,
+        ibra_region=ibra_region,
+        state=state,
+        latitude=lat,
+        longitude=lon,
+        material_code=material_code,
+        material_description=material_desc,
+        depth_cm_top=depth_top,
+        context=context,
+        method_code=method_code,
+        c14_age=c14_age,
+        c14_error=c14_error,
+        delta_c13=c13_age,
+        lum_age_ka=lum_age_ka,
+        lum_error_ka=lum_error_ka,
+        citation=citation,
+        is_rejected=is_rejected,
+        rejection_reason=rejection_reason,
+        quality_issues=quality_issues if quality_issues else None,
+        notes=notes,
+        coordinate_error=coordinate_error,
+    )
+
+
+def apply_parsed_row(
+    parsed: ParsedRow,
+    cursor,
+    ref_cache: ReferenceDataCache,
+    config: Config,
+    batch_id: uuid.UUID,
+    stats: IngestStats,
+    buffer: RowBuffer
+) -> None:
+    """Apply a parsed row to the database-side buffers."""
+
+    if parsed.coordinate_error:
+        stats.errors.append(parsed.coordinate_error)
+
+    # Check for duplicate lab code before creating any records
+    # (including rows buffered but not yet flushed to the database)
+    if parsed.lab_code in buffer.pending_lab_codes:
+        stats.ages_skipped += 1
+        return
+
+    if config.skip_existing and ref_cache.lab_code_exists(parsed.lab_code):
+        stats.ages_skipped += 1
+        return
+
+    lat, lon = parsed.latitude, parsed.longitude
+
+    # Find or create site
+    site_id = find_existing_site(cursor, ref_cache, parsed.site_name, lat, lon)
+
+    if site_id:
+        stats.sites_matched += 1
+    else:
+        cursor.execute("""
+            INSERT INTO site (site_name, latitude, longitude, state, site_type,
+                              region, bioregion_id, import_batch_id)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+            RETURNING id
+        """, (parsed.site_name, lat, lon, parsed.state, parsed.site_type,
+              parsed.ibra_region, ref_cache.lookup_bioregion(lat, lon),
+              batch_id))
+        site_id = cursor.fetchone()[0]
+        if lat is not None and lon is not None:
+            ref_cache.cache_site(site_id, normalize_site_name(parsed.site_name),
+                                 site_coord_key(lat, lon))
+        stats.sites_created += 1
+
+    material_id = ref_cache.get_material_id(parsed.material_code)
+    method_id = ref_cache.get_method_id(parsed.method_code)
+    source_id = (ref_cache.get_or_create_source(parsed.citation)
+                 if parsed.citation else None)
+
+    sample_row = (site_id, material_id, parsed.material_description,
+                  parsed.depth_cm_top, parsed.context)
 
+    is_c14 = parsed.method_code in ('C14', 'AMS', 'CONV')
+
+    # sample_id is filled in at flush time from the batched sample INSERT
+    buffer.add(sample_row, (
+        parsed.lab_code, method_id,
+        parsed.c14_age if is_c14 else None,
+        parsed.c14_error if is_c14 else None,
+        parsed.delta_c13,
+        parsed.lum_age_ka, parsed.lum_error_ka,
+        parsed.c14_age, parsed.c14_error,  # Use as general age
+        parsed.is_rejected, parsed.rejection_reason,
+        parsed.quality_issues,
+        source_id, parsed.notes, batch_id
+    ), parsed.lab_code)
+
+
+def flush_coord_updates(cursor, ref_cache: ReferenceDataCache) -> None:
+    """Apply deferred site coordinate backfills in a single UPDATE.
+
+    One unnest round-trip replaces an inline UPDATE per backfilled row;
+    with several updates queued for one site, the last row wins, as it
+    did when the updates ran inline.
+    """
+    if not ref_cache.pending_coord_updates:
+        return
+
+    latest = {site_id: (lat, lon)
+              for site_id, lat, lon in ref_cache.pending_coord_updates}
+    site_ids = list(latest)
     cursor.execute("""
-        INSERT INTO age_determination (
-            sample_id, lab_code, method_id,
-            c14_age, c14_error, delta_c13,
-            lum_age_ka, lum_error_ka,
-            age_bp, age_error,
-            is_rejected, rejection_reason, quality_issues,
-            data_source_id, notes, import_batch_id
+        UPDATE site s
+        SET latitude = v.lat, longitude = v.lon
+        FROM (SELECT * FROM unnest(%s::int[], %s::float8[], %s::float8[]))
+             AS v(id, lat, lon)
+        WHERE s.id = v.id
+    """, (site_ids,
+          [latest[i][0] for i in site_ids],
+          [latest[i][1] for i in site_ids]))
+    ref_cache.pending_coord_updates.clear()
+
+
+def process_row_batch(
+    parsed_rows: list,
+    cursor,
+    ref_cache: ReferenceDataCache,
+    config: Config,
+    batch_id: uuid.UUID,
+    stats: IngestStats,
+    buffer: RowBuffer
+) -> None:
+    """Apply a batch of parsed rows under a single savepoint.
+
+    Optimistic batch, pessimistic retry: the whole batch runs under one
+    savepoint (two round-trips instead of two per row). If any row fails,
+    the batch is rolled back and re-applied row by row with per-row
+    savepoints so only the bad records are lost.
+    """
+    snapshot = (stats.sites_created, stats.sites_matched, stats.ages_skipped,
+                len(stats.errors), len(buffer.ages),
+                len(ref_cache.pending_coord_updates))
+
+    try:
+        cursor.execute("SAVEPOINT batch_savepoint")
+        for parsed in parsed_rows:
+            apply_parsed_row(parsed, cursor, ref_cache, config, batch_id, stats, buffer)
+        cursor.execute("RELEASE SAVEPOINT batch_savepoint")
+        return
+    except Exception as e:
+        cursor.execute("ROLLBACK TO SAVEPOINT batch_savepoint")
+        logger.warning(f"Batch at row {parsed_rows[0].row_num} failed ({e}); "
+                       "retrying rows individually")
+        # Rewind Python-side state from the rolled-back rows
+        stats.sites_created, stats.sites_matched, stats.ages_skipped = snapshot[:3]
+        del stats.errors[snapshot[3]:]
+        del buffer.samples[snapshot[4]:]
+        del buffer.ages[snapshot[4]:]
+        del ref_cache.pending_coord_updates[snapshot[5]:]
+        buffer.pending_lab_codes = {age[0] for age in buffer.ages}
+        ref_cache.invalidate_caches()
+
+    for parsed in parsed_rows:
+        pending_updates = len(ref_cache.pending_coord_updates)
+        try:
+            cursor.execute("SAVEPOINT row_savepoint")
+            apply_parsed_row(parsed, cursor, ref_cache, config, batch_id, stats, buffer)
+            cursor.execute("RELEASE SAVEPOINT row_savepoint")
+        except Exception as e:
+            cursor.execute("ROLLBACK TO SAVEPOINT row_savepoint")
+            del ref_cache.pending_coord_updates[pending_updates:]
+            ref_cache.invalidate_caches()
+            stats.errors.append(f"Row {parsed.row_num}: {str(e)}")
+            if len(stats.errors) <= 5:  # Only log first 5 errors in detail
+                logger.warning(f"Error on row {parsed.row_num}: {e}")
+
+
+def file_sha256(filepath: Path) -> bytes:
+    """Content hash of a data file, as recorded in ingest_manifest."""
+    with open(filepath, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+            return hashlib.file_digest(f, 'sha256').digest()
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+        return digest.digest()
+
+
+def read_csv_rows_stdlib(filepath: Path, delimiter: str) -> tuple:
+    """Read a delimited file with the stdlib csv module.
+
+    Returns (header, row iterator); the iterator keeps the file open
+    until exhausted.
+    """
+    f = open(filepath, 'r', encoding='utf-8-sig', buffering=1 << 20)
+    reader = csv.reader(f, delimiter=delimiter)
+    header = next(reader, None)
+    if header is None:
+        f.close()
+        return None, iter(())
+
+    def rows():
+        with f:
+            yield from reader
+
+    return header, rows()
+
+
+def read_csv_rows(filepath: Path, delimiter: str) -> tuple:
+    """Return (header, row iterator) for a delimited data file.
+
+    Uses PyArrow's multithreaded CSV parser when it is installed, with
+    every column read as text and nothing treated as null so parsing
+    semantics match the csv module; otherwise (or if PyArrow cannot
+    parse the file) falls back to the stdlib reader.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError:
+        return read_csv_rows_stdlib(filepath, delimiter)
+
+    with open(filepath, 'r', encoding='utf-8-sig', buffering=1 << 20) as f:
+        header = next(csv.reader([f.readline()], delimiter=delimiter), None)
+    if not header:
+        return None, iter(())
+
+    try:
+        table = pacsv.read_csv(
+            filepath,
+            read_options=pacsv.ReadOptions(column_names=header, skip_rows=1,
+                                           block_size=64 << 20),
+            parse_options=pacsv.ParseOptions(delimiter=delimiter,
+                                             newlines_in_values=True),
+            convert_options=pacsv.ConvertOptions(
+                column_types={name: pa.string() for name in header},
+                null_values=[]),
         )
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-    """, (
-        sample_id, lab_code, method_id,
-        c14_age if method_code in ('C14', 'AMS', 'CONV') else None,
-        c14_error if method_code in ('C14', 'AMS', 'CONV') else None,
-        c13_age,
-        lum_age_ka, lum_error_ka,
-        c14_age, c14_error,  # Use as general age
-        is_rejected, rejection_reason,
-        quality_issues if quality_issues else None,
-        source_id, notes, batch_id
-    ))
-    stats.ages_created += 1
+    except pa.ArrowInvalid as e:
+        logger.warning(f"PyArrow could not parse {filepath.name} ({e}); "
+                       "falling back to the csv module")
+        return read_csv_rows_stdlib(filepath, delimiter)
+
+    def rows():
+        for batch in table.to_batches(max_chunksize=50000):
+            yield from zip(*(column.to_pylist() for column in batch.columns))
+
+    return header, rows()
+
+
+def parse_csv_file(filepath: Path, config: Config) -> tuple:
+    """Parse a CSV/TSV file into ParsedRow records without touching the DB.
+
+    Pure function, safe to run in a worker process. Returns
+    (parsed_rows, skipped, errors) where skipped counts rows without a
+    usable lab code.
+    """
+    parsed_rows = []
+    skipped = 0
+    errors = []
+
+    # The delimiter follows the file extension; no sniff-and-seek,
+    # so a non-seekable source (pipe, decompression stream) works too
+    delimiter = '\t' if filepath.suffix.lower() == '.tsv' else ','
+
+    header, row_iter = read_csv_rows(filepath, delimiter)
+    if header is None:
+        return parsed_rows, skipped, errors
+    columns = {name: i for i, name in enumerate(header)}
+    extract = make_row_extractor(columns)
+
+    for i, row in enumerate(row_iter):
+        if not row:
+            continue
+        try:
+            parsed = parse_row(extract(row), i + 1, config)
+        except Exception as e:
+            errors.append(f"Row {i + 1}: {str(e)}")
+            continue
+        if parsed is None:
+            skipped += 1
+        else:
+            parsed_rows.append(parsed)
+
+    return parsed_rows, skipped, errors
 
 
 def ingest_csv_file(
     filepath: Path,
-    processor_func,
     cursor,
     ref_cache: ReferenceDataCache,
     config: Config,
-    batch_id: uuid.UUID
+    batch_id: uuid.UUID,
+    parsed: Optional[tuple] = None
 ) -> IngestStats:
-    """Ingest a CSV file using the specified processor function."""
+    """Ingest a CSV file: parse (unless pre-parsed) and apply in batches."""
 
     stats = IngestStats()
 
     logger.info(f"Processing file: {filepath}")
 
-    with open(filepath, 'r', encoding='utf-8-sig') as f:
-        # Try to detect delimiter
-        sample = f.read(4096)
-        f.seek(0)
+    if parsed is None:
+        parsed = parse_csv_file(filepath, config)
+    parsed_rows, skipped, errors = parsed
+    stats.ages_skipped += skipped
+    stats.errors.extend(errors)
 
-        if '\t' in sample:
-            reader = csv.DictReader(f, delimiter='\t')
-        else:
-            reader = csv.DictReader(f)
+    buffer = RowBuffer()
 
-        for i, row in enumerate(reader):
-            try:
-                # Use savepoint so individual row errors don't abort transaction
-                cursor.execute("SAVEPOINT row_savepoint")
-                processor_func(row, cursor, ref_cache, config, batch_id, stats)
-                cursor.execute("RELEASE SAVEPOINT row_savepoint")
+    for start in range(0, len(parsed_rows), config.batch_size):
+        batch = parsed_rows[start:start + config.batch_size]
+        process_row_batch(batch, cursor, ref_cache, config, batch_id, stats, buffer)
+
+        # Flush only at batch boundaries so a batch rollback can
+        # never cross a flush
+        if len(buffer.ages) >= config.copy_flush_rows:
+            flush_row_buffer(cursor, buffer, ref_cache, config, stats)
 
-                if (i + 1) % 500 == 0:
-                    logger.info(f"  Processed {i + 1} rows...")
+        if start + config.batch_size < len(parsed_rows):
+            logger.info(f"  Processed {start + len(batch)} rows...")
 
-            except Exception as e:
-                cursor.execute("ROLLBACK TO SAVEPOINT row_savepoint")
-                stats.errors.append(f"Row {i + 1}: {str(e)}")
-                if len(stats.errors) <= 5:  # Only log first 5 errors in detail
-                    logger.warning(f"Error on row {i + 1}: {e}")
+    flush_row_buffer(cursor, buffer, ref_cache, config, stats)
+    flush_coord_updates(cursor, ref_cache)
 
     return stats
 
 
-def run_ingestion(config: Config) -> None:
+def run_ingestion(config: Config, pool) -> None:
     """Main ingestion pipeline."""
 
     logger.info("=" * 60)
@@ -715,10 +1306,16 @@ def run_ingestion(config: Config) -> None:
 
     logger.info(f"Found {len(csv_files)} data file(s)")
 
-    conn = get_connection(config)
+    conn = pool.getconn()
+    batch_id = None
 
     try:
         with conn.cursor() as cursor:
+            # The whole load runs in one transaction, so deferring the WAL
+            # fsync to the final commit is safe (a crash rolls back the
+            # batch either way) and removes fsync stalls during the load
+            cursor.execute("SET LOCAL synchronous_commit = OFF")
+
             # Create import batch record
             batch_id = uuid.uuid4()
             cursor.execute("""
@@ -731,24 +1328,43 @@ def run_ingestion(config: Config) -> None:
 
             total_stats = IngestStats()
 
+            # Skip citation/reference files - they don't contain age data
+            # (the unified row parser handles radiocarbon, OSL, TL, etc.
+            # based on the METHOD column)
+            data_files = []
             for filepath in csv_files:
                 filename = filepath.name.lower()
-
-                # Skip citation/reference files - they don't contain age data
                 if 'citation' in filename or 'reference' in filename:
                     logger.info(f"Skipping reference file: {filename}")
-                    continue
-
-                # Use unified processor for all age data
-                # (handles radiocarbon, OSL, TL, etc. based on METHOD column)
-                processor = process_radiocarbon_row
-                logger.info(f"Processing data file: {filename}")
+                else:
+                    data_files.append(filepath)
 
-                stats = ingest_csv_file(
-                    filepath, processor, cursor, ref_cache, config, batch_id
+            # Skip files whose content hash matches the last successful
+            # ingest, so incremental re-runs only pay for what changed
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS ingest_manifest (
+                    file VARCHAR(255) PRIMARY KEY,
+                    sha256 BYTEA NOT NULL,
+                    row_count INTEGER,
+                    loaded_at TIMESTAMPTZ DEFAULT NOW()
                 )
+            """)
+            cursor.execute("SELECT file, sha256 FROM ingest_manifest")
+            manifest = {row[0]: bytes(row[1]) for row in cursor.fetchall()}
+
+            digests = {}
+            fresh_files = []
+            for filepath in data_files:
+                digest = file_sha256(filepath)
+                if (not config.force_reingest
+                        and manifest.get(filepath.name) == digest):
+                    logger.info(f"Skipping unchanged file: {filepath.name}")
+                    continue
+                digests[filepath] = digest
+                fresh_files.append(filepath)
+            data_files = fresh_files
 
-                # Aggregate stats
+            def merge_stats(stats):
                 total_stats.sites_created += stats.sites_created
                 total_stats.sites_matched += stats.sites_matched
                 total_stats.samples_created += stats.samples_created
@@ -756,6 +1372,80 @@ def run_ingestion(config: Config) -> None:
                 total_stats.ages_skipped += stats.ages_skipped
                 total_stats.errors.extend(stats.errors)
 
+            def record_manifest(manifest_cursor, filepath, stats):
+                # Record the file as ingested at this content hash
+                manifest_cursor.execute("""
+                    INSERT INTO ingest_manifest (file, sha256, row_count, loaded_at)
+                    VALUES (%s, %s, %s, NOW())
+                    ON CONFLICT (file) DO UPDATE
+                        SET sha256 = EXCLUDED.sha256,
+                            row_count = EXCLUDED.row_count,
+                            loaded_at = EXCLUDED.loaded_at
+                """, (filepath.name, digests[filepath], stats.ages_created))
+
+            def ingest_one(filepath, parsed=None):
+                logger.info(f"Processing data file: {filepath.name.lower()}")
+
+                stats = ingest_csv_file(
+                    filepath, cursor, ref_cache, config, batch_id, parsed=parsed
+                )
+                merge_stats(stats)
+                record_manifest(cursor, filepath, stats)
+
+            def ingest_file_on_own_connection(filepath, parsed):
+                # --jobs worker: own pooled connection, cache and
+                # transaction, so files commit independently
+                worker_conn = pool.getconn()
+                try:
+                    with worker_conn.cursor() as worker_cursor:
+                        worker_cursor.execute("SET LOCAL synchronous_commit = OFF")
+                        worker_cache = ReferenceDataCache(worker_cursor)
+                        logger.info(f"Processing data file: {filepath.name.lower()}")
+                        stats = ingest_csv_file(
+                            filepath, worker_cursor, worker_cache, config,
+                            batch_id, parsed=parsed
+                        )
+                        record_manifest(worker_cursor, filepath, stats)
+                    worker_conn.commit()
+                    return stats
+                except Exception:
+                    worker_conn.rollback()
+                    raise
+                finally:
+                    pool.putconn(worker_conn)
+
+            jobs = min(max(config.jobs, 1), config.pool_max_connections - 1)
+
+            # Parsing is pure CPU work, so with several files the parse
+            # stage fans out across worker processes; with --jobs > 1 the
+            # apply stage also fans out, one pooled connection per file,
+            # otherwise this process applies every file serially
+            if jobs > 1 and len(data_files) > 1:
+                # Each worker commits its own file, so the batch record
+                # must be visible before they start
+                conn.commit()
+
+                workers = min(len(data_files), os.cpu_count() or 1)
+                with ProcessPoolExecutor(max_workers=workers) as parse_pool, \
+                        ThreadPoolExecutor(max_workers=jobs) as apply_pool:
+                    parsed_iter = parse_pool.map(parse_csv_file, data_files,
+                                                 repeat(config), chunksize=1)
+                    futures = [apply_pool.submit(ingest_file_on_own_connection,
+                                                 filepath, parsed)
+                               for filepath, parsed in zip(data_files, parsed_iter)]
+                    for future in futures:
+                        merge_stats(future.result())
+            elif len(data_files) > 1:
+                workers = min(len(data_files), os.cpu_count() or 1)
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    parsed_iter = executor.map(parse_csv_file, data_files,
+                                               repeat(config), chunksize=1)
+                    for filepath, parsed in zip(data_files, parsed_iter):
+                        ingest_one(filepath, parsed)
+            else:
+                for filepath in data_files:
+                    ingest_one(filepath)
+
             # Update import batch record
             cursor.execute("""
                 UPDATE import_batch
@@ -792,63 +1482,117 @@ def run_ingestion(config: Config) -> None:
 
     except Exception as e:
         conn.rollback()
+        # In --jobs mode the batch record was committed up front; mark it
+        # failed rather than leaving it 'running' (a no-op when the whole
+        # load was one rolled-back transaction)
+        if batch_id is not None:
+            try:
+                with conn.cursor() as err_cursor:
+                    err_cursor.execute("""
+                        UPDATE import_batch
+                        SET completed_at = NOW(),
+                            status = 'failed',
+                            error_log = %s
+                        WHERE id = %s AND status = 'running'
+                    """, (str(e), batch_id))
+                conn.commit()
+            except Exception:
+                conn.rollback()
         logger.error(f"Ingestion failed: {e}")
         raise
 
     finally:
-        conn.close()
+        pool.putconn(conn)
+
 
+def assign_bioregions(config: Config, pool) -> None:
+    """Post-ingestion: Assign bioregions to sites via spatial join.
 
-def assign_bioregions(config: Config) -> None:
-    """Post-ingestion: Assign bioregions to sites via spatial join."""
+    The join runs entirely in PostGIS (GiST-indexed ST_Contains); the
+    Python side only pages through candidate site ids so a large
+    backfill updates in bounded chunks, holding row locks briefly and
+    committing progress as it goes.
+    """
 
     logger.info("Assigning bioregions to sites...")
 
-    conn = get_connection(config)
+    conn = pool.getconn()
 
     try:
         with conn.cursor() as cursor:
-            cursor.execute("""
-                UPDATE site s
-                SET bioregion_id = b.id
-                FROM bioregion b
-                WHERE s.geom IS NOT NULL
-                  AND s.bioregion_id IS NULL
-                  AND ST_Contains(b.geom, s.geom)
-            """)
-
-            updated = cursor.rowcount
-            conn.commit()
+            updated = 0
+            last_id = 0
+
+            while True:
+                cursor.execute("""
+                    SELECT id FROM site
+                    WHERE id > %s
+                      AND geom IS NOT NULL
+                      AND bioregion_id IS NULL
+                    ORDER BY id
+                    LIMIT 50000
+                """, (last_id,))
+                chunk_ids = [row[0] for row in cursor.fetchall()]
+                if not chunk_ids:
+                    break
+
+                cursor.execute("""
+                    UPDATE site s
+                    SET bioregion_id = b.id
+                    FROM bioregion b
+                    WHERE s.id = ANY(%s)
+                      AND s.bioregion_id IS NULL
+                      AND ST_Contains(b.geom, s.geom)
+                """, (chunk_ids,))
+
+                updated += cursor.rowcount
+                conn.commit()
+                last_id = chunk_ids[-1]
 
             logger.info(f"Assigned bioregions to {updated} sites")
 
     finally:
-        conn.close()
+        pool.putconn(conn)
 
 
-def refresh_views(config: Config) -> None:
+def refresh_views(config: Config, pool) -> None:
     """Post-ingestion: Refresh materialized views."""
 
     logger.info("Refreshing materialized views...")
 
-    conn = get_connection(config)
+    conn = pool.getconn()
 
     try:
         with conn.cursor() as cursor:
-            cursor.execute("REFRESH MATERIALIZED VIEW mv_summary_stats")
+            cursor.execute("""
+                SELECT matviewname FROM pg_matviews
+                WHERE schemaname = 'public'
+                ORDER BY matviewname
+            """)
+            views = [row[0] for row in cursor.fetchall()]
+
+            if views:
+                # psycopg2 has no libpq pipeline mode, but joining the
+                # REFRESH statements into one execute submits them in a
+                # single round-trip just the same
+                from psycopg2.extensions import quote_ident
+                cursor.execute('; '.join(
+                    'REFRESH MATERIALIZED VIEW {}'.format(quote_ident(view, cursor))
+                    for view in views))
+
             conn.commit()
-            logger.info("Views refreshed successfully")
+            logger.info(f"Refreshed {len(views)} materialized view(s)")
 
     finally:
-        conn.close()
+        pool.putconn(conn)
 
 
-def validate_data(config: Config) -> None:
+def validate_data(config: Config, pool) -> None:
     """Post-ingestion: Run validation checks."""
 
     logger.info("Running validation checks...")
 
-    conn = get_connection(config)
+    conn = pool.getconn()
 
     try:
         with conn.cursor() as cursor:
@@ -873,15 +1617,18 @@ def validate_data(config: Config) -> None:
                 logger.info(f"  {status_icon} {metric}: {actual} (expected ~{expected})")
 
     finally:
-        conn.close()
+        # Read-only step: end its transaction before the connection goes
+        # back to the pool
+        conn.rollback()
+        pool.putconn(conn)
 
 
 # =============================================================================
 # CLI Interface
 # =============================================================================
 
-def main():
-    """Command-line interface."""
+def build_arg_parser():
+    """Build the full argparse parser (help text and usage errors only)."""
     import argparse
 
     parser = argparse.ArgumentParser(
@@ -916,41 +1663,167 @@ Environment variables:
                         help='Run all steps')
     parser.add_argument('--data-dir', type=Path,
                         help='Directory containing data files')
+    parser.add_argument('--use-copy', dest='use_copy', action='store_true',
+                        default=True,
+                        help='Bulk-load ages with COPY (default)')
+    parser.add_argument('--use-insert', dest='use_copy', action='store_false',
+                        help='Bulk-load ages with multi-VALUES INSERTs instead of COPY')
+    parser.add_argument('--page-size', type=int, metavar='N',
+                        help='Rows per execute_values statement (default: 1000; '
+                             'throughput plateaus past ~1000 on Postgres)')
+    parser.add_argument('--force', action='store_true',
+                        help='Re-ingest data files even if unchanged since the '
+                             'last successful run')
+    parser.add_argument('--jobs', type=int, metavar='N', default=1,
+                        help='Apply data files over N parallel connections '
+                             '(default: 1)')
+
+    return parser
+
+
+# Boolean CLI flags and the attribute each one sets
+BOOLEAN_FLAGS = {
+    '--ingest': 'ingest',
+    '--assign-bioregions': 'assign_bioregions',
+    '--refresh-views': 'refresh_views',
+    '--validate': 'validate',
+    '--all': 'all',
+    '--force': 'force',
+}
+
 
-    args = parser.parse_args()
+def parse_args(argv: list):
+    """Scan argv by hand so the common dispatch path stays stdlib-light.
+
+    argparse (and the gettext/textwrap machinery it drags in) is only
+    imported when help is requested or the arguments don't parse
+    cleanly, keeping plain invocations off that startup cost.
+    """
+    from types import SimpleNamespace
+
+    args = SimpleNamespace(ingest=False, assign_bioregions=False,
+                           refresh_views=False, validate=False, all=False,
+                           use_copy=True, force=False,
+                           data_dir=None, page_size=None, jobs=1)
+
+    try:
+        i = 0
+        while i < len(argv):
+            arg = argv[i]
+            if arg in ('-h', '--help'):
+                build_arg_parser().print_help()
+                raise SystemExit(0)
+            elif arg in BOOLEAN_FLAGS:
+                setattr(args, BOOLEAN_FLAGS[arg], True)
+            elif arg == '--use-copy':
+                args.use_copy = True
+            elif arg == '--use-insert':
+                args.use_copy = False
+            elif arg == '--data-dir' or arg.startswith('--data-dir='):
+                if '=' in arg:
+                    value = arg.split('=', 1)[1]
+                else:
+                    i += 1
+                    value = argv[i]
+                args.data_dir = Path(value)
+            elif arg == '--page-size' or arg.startswith('--page-size='):
+                if '=' in arg:
+                    value = arg.split('=', 1)[1]
+                else:
+                    i += 1
+                    value = argv[i]
+                args.page_size = int(value)
+            elif arg == '--jobs' or arg.startswith('--jobs='):
+                if '=' in arg:
+                    value = arg.split('=', 1)[1]
+                else:
+                    i += 1
+                    value = argv[i]
+                args.jobs = int(value)
+            else:
+                raise ValueError(arg)
+            i += 1
+    except (ValueError, IndexError):
+        # Hand the full argv to argparse for its usual usage error (or,
+        # should it accept something this scan does not, its parse)
+        return build_arg_parser().parse_args(argv)
+
+    return args
+
+
+def is_connection_error(e: Exception) -> bool:
+    """True for psycopg2's OperationalError, without importing the driver.
+
+    Keeps main's dispatch off the psycopg2 import; by the time such an
+    exception exists, the driver is loaded and its class is in the MRO.
+    """
+    return any(cls.__name__ == 'OperationalError'
+               and cls.__module__.startswith('psycopg2')
+               for cls in type(e).__mro__)
+
+
+def main():
+    """Command-line interface."""
+    args = parse_args(sys.argv[1:])
 
     config = Config()
 
     if args.data_dir:
         config.data_dir = args.data_dir
+    config.use_copy = args.use_copy
+    config.force_reingest = args.force
+    config.jobs = args.jobs
+    if args.page_size:
+        config.execute_values_page_size = args.page_size
 
     # Default to showing help if no action specified
     if not any([args.ingest, args.assign_bioregions, args.refresh_views,
                 args.validate, args.all]):
-        parser.print_help()
+        build_arg_parser().print_help()
         return
 
     try:
-        if args.all or args.ingest:
-            run_ingestion(config)
-
-        if args.all or args.assign_bioregions:
-            assign_bioregions(config)
-
-        if args.all or args.refresh_views:
-            refresh_views(config)
-
-        if args.all or args.validate:
-            validate_data(config)
+        pool = get_connection_pool(config)
+        try:
+            if args.all:
+                # Phase dependencies: bioregions and validation both only
+                # need ingest; refresh needs bioregions. Run the
+                # bioregions->refresh chain and validation concurrently on
+                # their own pooled connections
+                run_ingestion(config, pool)
+
+                def bioregions_then_refresh():
+                    assign_bioregions(config, pool)
+                    refresh_views(config, pool)
+
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    chain = executor.submit(bioregions_then_refresh)
+                    validation = executor.submit(validate_data, config, pool)
+                    chain.result()
+                    validation.result()
+            else:
+                if args.ingest:
+                    run_ingestion(config, pool)
+
+                if args.assign_bioregions:
+                    assign_bioregions(config, pool)
+
+                if args.refresh_views:
+                    refresh_views(config, pool)
+
+                if args.validate:
+                    validate_data(config, pool)
+        finally:
+            pool.closeall()
 
         logger.info("\nAll operations completed successfully!")
 
-    except psycopg2.OperationalError as e:
-        logger.error(f"Database connection failed: {e}")
-        logger.info("Check your database connection settings.")
-        sys.exit(1)
     except Exception as e:
-        logger.error(f"Operation failed: {e}")
+        if is_connection_error(e):
+            logger.error(f"Database connection failed: {e}")
+            logger.info("Check your database connection settings.")
+        else:
+            logger.error(f"Operation failed: {e}")
         sys.exit(1)
 
 
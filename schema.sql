@@ -112,7 +112,13 @@ CREATE TABLE site (
 );
 
 CREATE INDEX idx_site_geom ON site USING GIST(geom);
+-- Geography-cast index so the ingest proximity lookup
+-- (ST_DWithin on geom::geography) probes GiST instead of scanning
+CREATE INDEX idx_site_geog ON site USING GIST((geom::geography));
 CREATE INDEX idx_site_name ON site USING gin(site_name gin_trgm_ops);
+-- Functional index matching the ingest pipeline's exact-name lookup,
+-- so it probes a btree instead of scanning the table per row
+CREATE INDEX idx_site_name_normalized ON site (LOWER(REPLACE(site_name, ' ', '')));
 CREATE INDEX idx_site_bioregion ON site(bioregion_id);
 CREATE INDEX idx_site_state ON site(state);
 CREATE INDEX idx_site_type ON site(site_type);
@@ -267,6 +273,14 @@ CREATE INDEX idx_audit_time ON audit_log(changed_at);
 -- IMPORT TRACKING TABLE
 -- =============================================================================
 
+-- Per-file content hashes so unchanged data files skip re-ingestion
+CREATE TABLE ingest_manifest (
+    file VARCHAR(255) PRIMARY KEY,
+    sha256 BYTEA NOT NULL,
+    row_count INTEGER,
+    loaded_at TIMESTAMPTZ DEFAULT NOW()
+);
+
 CREATE TABLE import_batch (
     id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
     source_file VARCHAR(255),
@@ -129,6 +129,8 @@ HAVING COUNT(*) > 1;
 -- VALIDATION SUMMARY FUNCTION
 -- =============================================================================
 
+-- The age and site checks are fused with FILTER aggregates so each
+-- table is scanned once for all of its checks rather than once per check
 CREATE OR REPLACE FUNCTION validate_data_quality()
 RETURNS TABLE (
     check_name VARCHAR,
@@ -138,55 +140,62 @@ RETURNS TABLE (
 BEGIN
     RETURN QUERY
 
-    SELECT 'Sites outside Australia'::VARCHAR,
-           COUNT(*)::BIGINT,
-           'HIGH'::VARCHAR
-    FROM v_invalid_coordinates
+    WITH age_checks AS (
+        SELECT
+            COUNT(*) FILTER (WHERE
+                NOT is_valid_lab_code(ad.lab_code)
+                OR (dm.code = 'C14' AND NOT is_valid_c14_age(ad.c14_age, ad.c14_error))
+                OR (dm.code IN ('OSL', 'TL') AND NOT is_valid_lum_age(ad.lum_age_ka, ad.lum_error_ka))
+                OR (ad.c14_age IS NULL AND ad.lum_age_ka IS NULL AND ad.age_bp IS NULL)
+            ) AS quality_issues,
+            COUNT(*) FILTER (WHERE ad.data_source_id IS NULL) AS without_source,
+            COUNT(*) FILTER (WHERE ad.is_rejected) AS rejected
+        FROM age_determination ad
+        LEFT JOIN dating_method dm ON ad.method_id = dm.id
+    ),
+    site_checks AS (
+        SELECT
+            COUNT(*) FILTER (WHERE latitude IS NULL
+                                OR longitude IS NULL
+                                OR NOT is_valid_australian_coords(latitude, longitude)
+            ) AS invalid_coords,
+            COUNT(*) FILTER (WHERE bioregion_id IS NULL AND geom IS NOT NULL
+            ) AS without_bioregion
+        FROM site
+    )
+
+    SELECT 'Sites outside Australia'::VARCHAR, sc.invalid_coords, 'HIGH'::VARCHAR
+    FROM site_checks sc
 
     UNION ALL
 
-    SELECT 'Ages with quality issues'::VARCHAR,
-           COUNT(*)::BIGINT,
-           'MEDIUM'::VARCHAR
-    FROM v_quality_issues
+    SELECT 'Ages with quality issues'::VARCHAR, ac.quality_issues, 'MEDIUM'::VARCHAR
+    FROM age_checks ac
 
     UNION ALL
 
-    SELECT 'Duplicate lab codes'::VARCHAR,
-           COUNT(*)::BIGINT,
-           'HIGH'::VARCHAR
+    SELECT 'Duplicate lab codes'::VARCHAR, COUNT(*)::BIGINT, 'HIGH'::VARCHAR
     FROM v_duplicate_lab_codes
 
     UNION ALL
 
-    SELECT 'Samples without ages'::VARCHAR,
-           COUNT(*)::BIGINT,
-           'LOW'::VARCHAR
+    SELECT 'Samples without ages'::VARCHAR, COUNT(*)::BIGINT, 'LOW'::VARCHAR
     FROM v_orphaned_samples
 
     UNION ALL
 
-    SELECT 'Sites without bioregion'::VARCHAR,
-           COUNT(*)::BIGINT,
-           'LOW'::VARCHAR
-    FROM site
-    WHERE bioregion_id IS NULL AND geom IS NOT NULL
+    SELECT 'Sites without bioregion'::VARCHAR, sc.without_bioregion, 'LOW'::VARCHAR
+    FROM site_checks sc
 
     UNION ALL
 
-    SELECT 'Ages without source'::VARCHAR,
-           COUNT(*)::BIGINT,
-           'LOW'::VARCHAR
-    FROM age_determination
-    WHERE data_source_id IS NULL
+    SELECT 'Ages without source'::VARCHAR, ac.without_source, 'LOW'::VARCHAR
+    FROM age_checks ac
 
     UNION ALL
 
-    SELECT 'Rejected ages'::VARCHAR,
-           COUNT(*)::BIGINT,
-           'INFO'::VARCHAR
-    FROM age_determination
-    WHERE is_rejected = TRUE;
+    SELECT 'Rejected ages'::VARCHAR, ac.rejected, 'INFO'::VARCHAR
+    FROM age_checks ac;
 
 END;
 $$ LANGUAGE plpgsql;